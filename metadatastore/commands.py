@@ -153,7 +153,7 @@ def descriptors_by_start(run_start):
     Returns
     -------
     event_descriptors : list
-        A list of EventDescriptor documents
+        A list of EventDescriptor documents, oldest first
 
     Raises
     ------
@@ -330,7 +330,8 @@ def insert_descriptor(run_start, data_keys, time, uid, **kwargs):
 insert_event_descriptor = insert_descriptor
 
 
-def insert_event(descriptor, time, seq_num, data, timestamps, uid):
+def insert_event(descriptor, time, seq_num, data, timestamps, uid,
+                 write_concern=None):
     """Create an event in metadatastore database backend
 
     .. warning
@@ -356,12 +357,19 @@ def insert_event(descriptor, time, seq_num, data, timestamps, uid):
         same keys as `data` above
     uid : str
         Globally unique id string provided to metadatastore
+    write_concern : pymongo.write_concern.WriteConcern, optional
+        Write concern to use instead of the collection's default.
+        ``WriteConcern(w=0)`` does not wait for the server to acknowledge
+        the write, which is much faster for high-rate streams but means
+        errors (such as duplicate uids) are silently dropped.
     """
     return _DB_SINGLETON.insert_event(descriptor, time, seq_num,
-                                      data, timestamps, uid)
+                                      data, timestamps, uid,
+                                      write_concern=write_concern)
 
 
-def bulk_insert_events(event_descriptor, events, validate=False):
+def bulk_insert_events(event_descriptor, events, validate=False,
+                       chunk_size=1000, write_concern=None):
     """Bulk insert many events
 
     Parameters
@@ -374,14 +382,25 @@ def bulk_insert_events(event_descriptor, events, validate=False):
     validate : bool, optional
        If it should be checked that each pair of data/timestamps
        dicts has identical keys
+    chunk_size : int, optional
+       Maximum number of events sent to the server per round-trip,
+       1000 by default.  Must be at least 1.
+    write_concern : pymongo.write_concern.WriteConcern, optional
+       Write concern to use instead of the collection's default.
+       ``WriteConcern(w=0)`` does not wait for the server to acknowledge
+       the write, which is much faster for high-rate streams but means
+       errors (such as duplicate uids) are silently dropped.
 
     Returns
     -------
     ret : dict
-        dictionary of details about the insertion
+        dictionary of details about the insertion, see
+        `metadatastore.core.bulk_insert_events`
     """
     return _DB_SINGLETON.bulk_insert_events(descriptor=event_descriptor,
-                                            events=events, validate=validate)
+                                            events=events, validate=validate,
+                                            chunk_size=chunk_size,
+                                            write_concern=write_concern)
 
 
 # DATABASE RETRIEVAL ##########################################################
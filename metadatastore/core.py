@@ -121,6 +121,8 @@ def _cache_run_stop(run_stop, run_stop_cache,
 
     run_stop_cache[run_stop['uid']] = run_stop
     run_stop_cache[oid] = run_stop
+    # also index by RunStart so `stop_by_start` can skip the database
+    run_stop_cache[('run_start', run_start_uid)] = run_stop
 
     return run_stop
 
@@ -283,6 +285,13 @@ def stop_by_start(run_start, run_stop_col, run_stop_cache,
         If no RunStop document exists for the given RunStart
     """
     run_start_uid = doc_or_uid_to_uid(run_start)
+    # There is at most one RunStop per RunStart and documents are never
+    # updated, so a cached hit can not go stale.  Misses are not cached.
+    try:
+        return run_stop_cache[('run_start', run_start_uid)]
+    except KeyError:
+        pass
+
     run_stop = run_stop_col.find_one({'run_start': run_start_uid})
     if run_stop is None:
         raise NoRunStop("No run stop exists for {!r}".format(run_start))
@@ -306,7 +315,7 @@ def descriptors_by_start(run_start, descriptor_col, descriptor_cache,
     Returns
     -------
     event_descriptors : list
-        A list of EventDescriptor documents
+        A list of EventDescriptor documents, oldest first
 
     Raises
     ------
@@ -317,8 +326,10 @@ def descriptors_by_start(run_start, descriptor_col, descriptor_cache,
     run_start_uid = doc_or_uid_to_uid(run_start)
 
     # query the database for any event descriptors which
-    # refer to the given run_start
-    descriptors = descriptor_col.find({'run_start': run_start_uid})
+    # refer to the given run_start, let the (run_start, time) index
+    # do the ordering
+    descriptors = descriptor_col.find({'run_start': run_start_uid},
+                                      sort=[('time', pymongo.ASCENDING)])
     # loop over the found documents, cache, and dereference
     rets = [_cache_descriptor(descriptor, descriptor_cache,
                               run_start_col, run_start_cache)
@@ -357,7 +368,9 @@ def get_events_generator(descriptor, event_col, descriptor_col,
                                       descriptor_cache, run_start_col,
                                       run_start_cache)
     col = event_col
+    # the ObjectId is never used, do not ship it over the wire
     ev_cur = col.find({'descriptor': descriptor_uid},
+                      projection={'_id': False},
                       sort=[('descriptor', pymongo.DESCENDING),
                             ('time', pymongo.ASCENDING)])
 
@@ -365,9 +378,6 @@ def get_events_generator(descriptor, event_col, descriptor_col,
     external_keys = [k for k in data_keys if 'external' in data_keys[k]]
     filled = {k: False for k in external_keys}
     for ev in ev_cur:
-        # ditch the ObjectID
-        del ev['_id']
-
         # replace descriptor with the defererenced descriptor
         ev['descriptor'] = descriptor
         for k, v in ev['data'].items():
@@ -407,12 +417,8 @@ def _transpose(in_data, keys, field):
     transpose : dict
         The transpose of the data
     """
-    out = {k: [None] * len(in_data) for k in keys}
-    for j, ev in enumerate(in_data):
-        dd = ev[field]
-        for k in keys:
-            out[k][j] = dd[k]
-    return out
+    inner = [ev[field] for ev in in_data]
+    return {k: [dd[k] for dd in inner] for k in keys}
 
 
 def get_events_table(descriptor, event_col, descriptor_col,
@@ -563,14 +569,6 @@ def insert_run_stop(run_start_col, run_start_cache,
     run_start_uid = doc_or_uid_to_uid(run_start)
     run_start = run_start_given_uid(run_start_uid, run_start_col,
                                     run_start_cache)
-    try:
-        stop_by_start(run_start_uid,
-                      run_stop_col, run_stop_cache,
-                      run_start_col, run_start_cache)
-    except NoRunStop:
-        pass
-    else:
-        raise RuntimeError("Runstop already exits for {!r}".format(run_start))
 
     col = run_stop_col
     run_stop = dict(run_start=run_start_uid, time=time, uid=uid,
@@ -578,7 +576,14 @@ def insert_run_stop(run_start_col, run_start_cache,
     if reason is not None and reason != '':
         run_stop['reason'] = reason
 
-    col.insert_one(run_stop)
+    # rely on the unique index on 'run_start' rather than looking for an
+    # existing RunStop first; only pay for the extra query on failure
+    try:
+        col.insert_one(run_stop)
+    except pymongo.errors.DuplicateKeyError:
+        if col.find_one({'run_start': run_start_uid}) is None:
+            raise
+        raise RuntimeError("Runstop already exits for {!r}".format(run_start))
     _cache_run_stop(run_stop, run_stop_cache, run_start_col, run_start_cache)
     logger.debug("Inserted RunStop with uid %s referencing RunStart "
                  " with uid %s", run_stop['uid'], run_start['uid'])
@@ -643,7 +648,7 @@ insert_event_descriptor = insert_descriptor
 
 
 def insert_event(event_col, descriptor, time, seq_num, data, timestamps, uid,
-                 validate):
+                 validate, write_concern=None):
     """Create an event in metadatastore database backend
 
     .. warning
@@ -669,6 +674,14 @@ def insert_event(event_col, descriptor, time, seq_num, data, timestamps, uid,
         same keys as `data` above
     uid : str
         Globally unique id string provided to metadatastore
+    write_concern : pymongo.write_concern.WriteConcern, optional
+        Write concern to use instead of the collection's default.
+        ``WriteConcern(w=0)`` does not wait for the server to acknowledge
+        the write, which is much faster for high-rate streams but means
+        errors (such as duplicate uids) are silently dropped.
+        Applying it builds a new Collection on each call; when inserting
+        many events pass a collection that already has it instead (as
+        `MDS.insert_event` does).
     """
     if validate:
         raise NotImplementedError("insert event validation not written yet")
@@ -677,6 +690,8 @@ def insert_event(event_col, descriptor, time, seq_num, data, timestamps, uid,
     descriptor_uid = doc_or_uid_to_uid(descriptor)
 
     col = event_col
+    if write_concern is not None:
+        col = col.with_options(write_concern=write_concern)
 
     event = dict(descriptor=descriptor_uid, uid=uid,
                  data=data, timestamps=timestamps, time=time,
@@ -693,9 +708,15 @@ BAD_KEYS_FMT = """Event documents are malformed, the keys on 'data' and
 'timestamps do not match:\n data: {}\ntimestamps:{}"""
 
 
-def bulk_insert_events(event_col, descriptor, events, validate):
+def bulk_insert_events(event_col, descriptor, events, validate,
+                       chunk_size=1000, write_concern=None):
     """Bulk insert many events
 
+    Events are sent to the server in ordered chunks of `chunk_size`.
+    Insertion stops at the first failing event (e.g. a duplicate uid)
+    and raises ``pymongo.errors.BulkWriteError``; the events before it,
+    including earlier chunks, stay inserted.
+
     Parameters
     ----------
     event_descriptor : doc.Document or dict or str
@@ -705,13 +726,29 @@ def bulk_insert_events(event_col, descriptor, events, validate):
        iterable of dicts matching the bs.Event schema
     validate : bool
        If it should be checked that each pair of data/timestamps
-       dicts has identical keys
+       dicts has identical keys.  All events are checked before the
+       first chunk is sent, so a bad event means nothing is inserted,
+       at the cost of holding the whole input in memory.
+    chunk_size : int, optional
+       Maximum number of events sent to the server per ``insert_many``
+       call, 1000 by default.  Must be at least 1.
+    write_concern : pymongo.write_concern.WriteConcern, optional
+       Write concern to use instead of the collection's default.
+       ``WriteConcern(w=0)`` does not wait for the server to acknowledge
+       the write, which is much faster for high-rate streams but means
+       errors (such as duplicate uids) are silently dropped.
 
     Returns
     -------
     ret : dict
-        dictionary of details about the insertion
+        dictionary of details about the insertion, with the same keys
+        as the result of a pymongo bulk write plus 'acknowledged'.  With
+        an unacknowledged write concern (``w=0``) the server reports
+        nothing back: 'acknowledged' is False and 'nInserted' is 0.
     """
+    if chunk_size is None or chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1, "
+                         "not {!r}".format(chunk_size))
     descriptor_uid = doc_or_uid_to_uid(descriptor)
 
     def event_factory():
@@ -729,11 +766,36 @@ def bulk_insert_events(event_col, descriptor, events, validate):
                           seq_num=ev['seq_num'])
             yield ev_out
 
-    bulk = event_col.initialize_ordered_bulk_op()
-    for ev in event_factory():
-        bulk.insert(ev)
+    to_insert = event_factory()
+    if validate:
+        # validate everything up front so a bad event inserts nothing
+        to_insert = list(to_insert)
+
+    if write_concern is not None:
+        event_col = event_col.with_options(write_concern=write_concern)
 
-    return bulk.execute()
+    ret = {'writeErrors': [], 'writeConcernErrors': [], 'nInserted': 0,
+           'nUpserted': 0, 'nMatched': 0, 'nModified': 0, 'nRemoved': 0,
+           'upserted': [], 'acknowledged': True}
+
+    def send(chunk):
+        res = event_col.insert_many(chunk, ordered=True)
+        if res.acknowledged:
+            ret['nInserted'] += len(res.inserted_ids)
+        else:
+            ret['acknowledged'] = False
+
+    chunk = []
+    for ev in to_insert:
+        chunk.append(ev)
+        if len(chunk) >= chunk_size:
+            send(chunk)
+            chunk = []
+    # mongo refuses an empty insert_many, only send what is left over
+    if chunk:
+        send(chunk)
+
+    return ret
 
 
 def _transform_data(data, timestamps):
@@ -776,6 +838,9 @@ _TS_FORMATS = [
     '%Y-%m',
     '%Y']
 
+# unix epoch used to convert datetimes to timestamps
+_EPOCH = pytz.UTC.localize(datetime.datetime(1970, 1, 1))
+
 # build a tab indented, '-' bulleted list of supported formats
 # to append to the parsing function docstring below
 _doc_ts_formats = '\n'.join('\t- {}'.format(_) for _ in _TS_FORMATS)
@@ -795,9 +860,8 @@ def _normalize_human_friendly_time(val, tz):
     """
     # {} is placeholder for formats; filled in after def...
 
+    # resolve the zone first so a bad tz raises for every input
     zone = pytz.timezone(tz)  # tz as datetime.tzinfo object
-    epoch = pytz.UTC.localize(datetime.datetime(1970, 1, 1))
-    check = True
 
     if isinstance(val, six.string_types):
         # unix 'date' cmd format '%a %b %d %H:%M:%S %Z %Y' works but
@@ -812,24 +876,15 @@ def _normalize_human_friendly_time(val, tz):
 
         for fmt in _TS_FORMATS:
             try:
-                ts = datetime.datetime.strptime(val, fmt)
+                val = datetime.datetime.strptime(val, fmt)
                 break
             except ValueError:
                 pass
-
-        try:
-            if isinstance(ts, datetime.datetime):
-                val = ts
-                check = False
-            else:
-                # what else could the type be here?
-                raise TypeError('expected datetime.datetime,'
-                                ' got {:r}'.format(ts))
-
-        except NameError:
+        else:
             raise ValueError('failed to parse time: ' + repr(val))
 
-    if check and not isinstance(val, datetime.datetime):
+    elif not isinstance(val, datetime.datetime):
+        # timestamps (the common case) pass straight through
         return val
 
     if val.tzinfo is None:
@@ -837,7 +892,7 @@ def _normalize_human_friendly_time(val, tz):
         # when appropriate, same as pandas
         val = zone.localize(val, is_dst=None)
 
-    return (val - epoch).total_seconds()
+    return (val - _EPOCH).total_seconds()
 
 
 # fill in the placeholder we left in the previous docstring
@@ -846,6 +901,57 @@ _normalize_human_friendly_time.__doc__ = (
 )
 
 
+def _find_with_run_start(col, query, sort, run_start_col, run_start_cache,
+                         batch_size=1000):
+    """Search a collection whose documents reference a RunStart
+
+    Results are read in batches; the RunStarts referenced by a batch
+    that are not already cached are fetched with a single ``$in`` query
+    and cached, so de-referencing the results does not cost one query
+    per distinct RunStart.  With a warm cache no extra query is made.
+
+    Parameters
+    ----------
+    col : pymongo.Collection
+        The collection to search
+    query : dict
+        The search criteria
+    sort : list
+        (key, direction) pairs, as passed to ``Collection.find``
+    run_start_col : pymongo.Collection
+        The RunStart collection
+    run_start_cache : MutableMapping
+        Mutable mapping to serve as a local cache
+    batch_size : int, optional
+        Number of results to gather per RunStart query, 1000 by default
+
+    Yields
+    ------
+    raw : dict
+        The raw documents from `col`
+    """
+    def prefetch(batch):
+        missing = set(raw['run_start'] for raw in batch
+                      if 'run_start' in raw)
+        missing = [uid for uid in missing if uid not in run_start_cache]
+        if missing:
+            for run_start in run_start_col.find({'uid': {'$in': missing}}):
+                _cache_run_start(run_start, run_start_cache)
+
+    batch = []
+    for raw in col.find(query, sort=sort):
+        batch.append(raw)
+        if len(batch) >= batch_size:
+            prefetch(batch)
+            for ready in batch:
+                yield ready
+            batch = []
+    if batch:
+        prefetch(batch)
+        for ready in batch:
+            yield ready
+
+
 def find_run_starts(run_start_col, run_start_cache, tz, **kwargs):
     """Given search criteria, locate RunStart Documents.
 
@@ -937,8 +1043,9 @@ def find_run_stops(start_col, start_cache,
         kwargs['run_start'] = run_start_uid
 
     _format_time(kwargs, tz)
-    col = stop_col
-    run_stop = col.find(kwargs, sort=[('time', pymongo.ASCENDING)])
+    run_stop = _find_with_run_start(stop_col, kwargs,
+                                    [('time', pymongo.ASCENDING)],
+                                    start_col, start_cache)
 
     for rs in run_stop:
         yield _cache_run_stop(rs, stop_cache, start_col, start_cache)
@@ -980,9 +1087,9 @@ def find_descriptors(start_col, start_cache,
 
     _format_time(kwargs, tz)
 
-    col = descriptor_col
-    event_descriptor_objects = col.find(kwargs,
-                                        sort=[('time', pymongo.ASCENDING)])
+    event_descriptor_objects = _find_with_run_start(
+        descriptor_col, kwargs, [('time', pymongo.ASCENDING)],
+        start_col, start_cache)
 
     for event_descriptor in event_descriptor_objects:
         yield _cache_descriptor(event_descriptor, descriptor_cache,
@@ -1028,17 +1135,22 @@ def find_events(start_col, start_cache,
     _format_time(kwargs, tz)
     col = event_col
     events = col.find(kwargs,
+                      projection={'_id': False},
                       sort=[('descriptor', pymongo.DESCENDING),
                             ('time', pymongo.ASCENDING)])
 
+    ev_desc = None
     for ev in events:
-        ev.pop('_id', None)
         # pop the descriptor oid
         desc_uid = ev.pop('descriptor')
+        # events come out grouped by descriptor, so only de-reference
+        # when it changes
+        if ev_desc is None or ev_desc['uid'] != desc_uid:
+            ev_desc = descriptor_given_uid(desc_uid, descriptor_col,
+                                           descriptor_cache,
+                                           start_col, start_cache)
         # replace it with the defererenced descriptor
-        ev['descriptor'] = descriptor_given_uid(desc_uid, descriptor_col,
-                                                descriptor_cache,
-                                                start_col, start_cache)
+        ev['descriptor'] = ev_desc
 
         # wrap it our fancy dict
         ev = doc.Document('Event', ev)
@@ -1058,6 +1170,10 @@ def find_last(start_col, start_cache, num):
     run_start doc.Document
        The requested RunStart documents
     """
+    # a limit of 0 means 'no limit' to mongo, do not fetch everything;
+    # negative values are left to mongo, which returns abs(num) documents
+    if num == 0:
+        return
     col = start_col
-    for rs in col.find().sort('time', pymongo.DESCENDING).limit(num):
+    for rs in col.find(sort=[('time', pymongo.DESCENDING)], limit=num):
         yield _cache_run_start(rs, start_cache)
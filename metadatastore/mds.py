@@ -10,19 +10,37 @@ _API_MAP = {1: core}
 
 
 class MDSRO(object):
-    def __init__(self, config, version=1):
-        self._RUNSTART_CACHE = {}
-        self._RUNSTOP_CACHE = {}
-        self._DESCRIPTOR_CACHE = {}
+    """Read-only access to a metadatastore database
+
+    Parameters
+    ----------
+    config : dict
+        Connection configuration, must have 'host', 'database' and
+        'timezone' and may have 'port' and 'max_pool_size' (the maximum
+        number of connections the client keeps open, overriding any
+        value given in the host URI or PyMongo's default)
+    version : int, optional
+        The schema version of the database, 1 by default
+    cache_factory : callable, optional
+        Called with no arguments to create each of the local document
+        caches, `dict` by default.  Pass a bounded mapping (for example a
+        ``cachetools.TTLCache`` wrapped in ``functools.partial``) to limit
+        the memory used by long-running sessions.  It is pickled along
+        with the instance, so it must be picklable (no lambdas or locally
+        defined classes) for the instance to be sent to other processes.
+    """
+    def __init__(self, config, version=1, cache_factory=dict):
+        self._cache_factory = cache_factory
+        self._RUNSTART_CACHE = cache_factory()
+        self._RUNSTOP_CACHE = cache_factory()
+        self._DESCRIPTOR_CACHE = cache_factory()
         self.reset_connection()
         self.config = config
         self._api = None
         self.version = version
 
     def reset_caches(self):
-        self._RUNSTART_CAHCE.clear()
-        self._RUNSTOP_CAHCE.clear()
-        self._DESCRIPTOR_CAHCE.clear()
+        self.clear_process_cache()
 
     def reset_connection(self):
         self.__conn = None
@@ -34,16 +52,26 @@ class MDSRO(object):
         self.__runstart_col = None
         self.__runstop_col = None
 
+        self.__event_cols_by_wc = {}
+
     def __getstate__(self):
-        return self.version, self.config
+        return self.version, self.config, self._cache_factory
 
     def __setstate__(self, state):
-        self._RUNSTART_CACHE = {}
-        self._RUNSTOP_CACHE = {}
-        self._DESCRIPTOR_CACHE = {}
+        # instances pickled before cache_factory existed only carry
+        # (version, config)
+        if len(state) == 2:
+            version, config = state
+            cache_factory = dict
+        else:
+            version, config, cache_factory = state
+        self._cache_factory = cache_factory
+        self._RUNSTART_CACHE = cache_factory()
+        self._RUNSTOP_CACHE = cache_factory()
+        self._DESCRIPTOR_CACHE = cache_factory()
         self.reset_connection()
         self._api = None
-        self.version, self.config = state
+        self.version, self.config = version, config
 
     @property
     def version(self):
@@ -57,15 +85,11 @@ class MDSRO(object):
         self._version = val
 
     def disconnect(self):
-
-        self.__conn = None
-
-        self.__db = None
-
-        self.__event_col = None
-        self.__descriptor_col = None
-        self.__runstart_col = None
-        self.__runstop_col = None
+        # close the client so its pooled sockets and monitor threads do
+        # not linger until garbage collection
+        if self.__conn is not None:
+            self.__conn.close()
+        self.reset_connection()
 
     def reconfigure(self, config):
         self.disconnect()
@@ -74,8 +98,14 @@ class MDSRO(object):
     @property
     def _connection(self):
         if self.__conn is None:
+            kwargs = {}
+            # only override the pool size when asked to, so that options
+            # given in a mongodb:// host URI are not clobbered
+            if 'max_pool_size' in self.config:
+                kwargs['maxPoolSize'] = self.config['max_pool_size']
             self.__conn = MongoClient(self.config['host'],
-                                      self.config.get('port', None))
+                                      self.config.get('port', None),
+                                      **kwargs)
         return self.__conn
 
     @property
@@ -95,6 +125,9 @@ class MDSRO(object):
             self.__runstart_col.create_index([('time', pymongo.DESCENDING),
                                               ('scan_id', pymongo.DESCENDING)],
                                              unique=False, background=True)
+            # the (time, scan_id) index can not serve scan_id lookups
+            self.__runstart_col.create_index([('scan_id', pymongo.DESCENDING)],
+                                             unique=False, background=True)
             self.__runstart_col.create_index([("$**", "text")])
 
         return self.__runstart_col
@@ -163,6 +196,24 @@ class MDSRO(object):
                                    " schema version {!r}".format(self.version))
         return self.__event_col
 
+    def _event_col_with(self, write_concern):
+        """The event collection with the given write concern
+
+        ``Collection.with_options`` builds a new Collection each time, so
+        the handle for each write concern is made once per connection.
+        """
+        if write_concern is None:
+            return self._event_col
+        # WriteConcern is not hashable, key on its document instead
+        key = tuple(sorted(write_concern.document.items()))
+        try:
+            return self.__event_cols_by_wc[key]
+        except KeyError:
+            pass
+        col = self._event_col.with_options(write_concern=write_concern)
+        self.__event_cols_by_wc[key] = col
+        return col
+
     def clear_process_cache(self):
         """Clear all local caches"""
         self._RUNSTART_CACHE.clear()
@@ -286,7 +337,7 @@ class MDSRO(object):
         Returns
         -------
         event_descriptors : list
-            A list of EventDescriptor documents
+            A list of EventDescriptor documents, oldest first
 
         Raises
         ------
@@ -656,7 +707,7 @@ class MDS(MDSRO):
                                            **kwargs)
 
     def insert_event(self, descriptor, time, seq_num, data, timestamps, uid,
-                     validate=False):
+                     validate=False, write_concern=None):
         """Create an event in metadatastore database backend
 
         .. warning
@@ -682,22 +733,13 @@ class MDS(MDSRO):
             same keys as `data` above
         uid : str
             Globally unique id string provided to metadatastore
+        write_concern : pymongo.write_concern.WriteConcern, optional
+            Write concern to use instead of the collection's default.
+            ``WriteConcern(w=0)`` does not wait for the server to acknowledge
+            the write, which is much faster for high-rate streams but means
+            errors (such as duplicate uids) are silently dropped.
         """
-
-        if self.version == 0:
-            return self._api.insert_event(self._event_col,
-                                          descriptor=descriptor,
-                                          time=time, seq_num=seq_num,
-                                          data=data,
-                                          timestamps=timestamps,
-                                          uid=uid,
-                                          validate=validate,
-                                          descriptor_col=self._descriptor_col,
-                                          descriptor_cache=self._DESCRIPTOR_CACHE,
-                                          start_col=self._runstart_col,
-                                          start_cache=self._RUNSTART_CACHE)
-
-        return self._api.insert_event(self._event_col,
+        return self._api.insert_event(self._event_col_with(write_concern),
                                       descriptor=descriptor,
                                       time=time, seq_num=seq_num,
                                       data=data,
@@ -705,21 +747,39 @@ class MDS(MDSRO):
                                       uid=uid,
                                       validate=validate)
 
-    def bulk_insert_events(self, descriptor, events, validate=False):
-
-        if self.version == 0:
-            return self._api.bulk_insert_events(self._event_col,
-                                                descriptor=descriptor,
-                                                events=events,
-                                                validate=validate,
-                                                descriptor_col=self._descriptor_col,
-                                                descriptor_cache=self._DESCRIPTOR_CACHE,
-                                                start_col=self._runstart_col,
-                                                start_cache=self._RUNSTART_CACHE)
-        return self._api.bulk_insert_events(self._event_col,
-                                            descriptor=descriptor,
-                                            events=events,
-                                            validate=validate)
+    def bulk_insert_events(self, descriptor, events, validate=False,
+                           chunk_size=1000, write_concern=None):
+        """Bulk insert many events
+
+        Parameters
+        ----------
+        descriptor : doc.Document or dict or str
+            The Descriptor to insert event for.  Can be either
+            a Document/dict with a 'uid' key or a uid string
+        events : iterable
+           iterable of dicts matching the bs.Event schema
+        validate : bool, optional
+           If it should be checked that each pair of data/timestamps
+           dicts has identical keys
+        chunk_size : int, optional
+           Maximum number of events sent to the server per round-trip,
+           1000 by default.  Must be at least 1.
+        write_concern : pymongo.write_concern.WriteConcern, optional
+           Write concern to use instead of the collection's default.
+           ``WriteConcern(w=0)`` does not wait for the server to acknowledge
+           the write, which is much faster for high-rate streams but means
+           errors (such as duplicate uids) are silently dropped.
+
+        Returns
+        -------
+        ret : dict
+            dictionary of details about the insertion, see
+            `metadatastore.core.bulk_insert_events`
+        """
+        return self._api.bulk_insert_events(
+            self._event_col_with(write_concern),
+            descriptor=descriptor, events=events, validate=validate,
+            chunk_size=chunk_size)
 
     def insert(self, name, doc):
         if name != 'bulk_events':
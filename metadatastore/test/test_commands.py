@@ -400,6 +400,14 @@ def test_normalize_human_friendly_time():
         yield _normalize_human_friendly_time_tester, val, False, ValueError
 
 
+def test_normalize_human_friendly_time_bad_tz():
+    # a misconfigured timezone must not pass silently for any input
+    for val in (ttime.time(), '2015', datetime.datetime.now(),
+                pytz.UTC.localize(datetime.datetime.now())):
+        with pytest.raises(pytz.UnknownTimeZoneError):
+            core._normalize_human_friendly_time(val, 'Not/AZone')
+
+
 def test_bulk_insert():
     num = 50
     rs, e_desc, data_keys = setup_syn()
@@ -525,6 +533,11 @@ def test_find_last(prep_header, mds_all):
     next(mds_all.find_last())['uid'] == refhdr['uid']
 
 
+def test_find_last_zero(prep_header, mds_all):
+    mds_all.insert('start', prep_header)
+    assert list(mds_all.find_last(0)) == []
+
+
 def test_insert_basic(prep_header, mds_all):
    mds_all.insert('start', prep_header)
 
@@ -1,5 +1,7 @@
-from collections import deque
+from collections import deque, OrderedDict
 import pickle
+import pymongo
+import pymongo.errors
 import time as ttime
 import uuid
 import pytest
@@ -7,7 +9,8 @@ import warnings
 import datetime
 
 from metadatastore.mds import MDS
-from metadatastore.core import (NoRunStart, NoEventDescriptors)
+from metadatastore import core
+from metadatastore.core import (NoRunStart, NoRunStop, NoEventDescriptors)
 
 
 def check_for_id(document):
@@ -73,6 +76,64 @@ def test_pickle(ver):
     assert md.config == md2.config
 
 
+def test_cache_factory():
+    md = MDS(config={'host': 'portland'}, version=1,
+             cache_factory=OrderedDict)
+    md2 = pickle.loads(pickle.dumps(md))
+
+    for m in (md, md2):
+        for cache in (m._RUNSTART_CACHE, m._RUNSTOP_CACHE,
+                      m._DESCRIPTOR_CACHE):
+            assert isinstance(cache, OrderedDict)
+
+
+def test_unpickle_old_state():
+    # pickles from before cache_factory carry only (version, config)
+    config = {'host': 'portland'}
+    md = MDS.__new__(MDS)
+    md.__setstate__((1, config))
+
+    assert md.version == 1
+    assert md.config == config
+    for cache in (md._RUNSTART_CACHE, md._RUNSTOP_CACHE,
+                  md._DESCRIPTOR_CACHE):
+        assert type(cache) is dict
+
+
+def _max_pool_size(client):
+    # PyMongo 4 moved this from MongoClient.max_pool_size to .options
+    options = getattr(client, 'options', None)
+    if options is not None:
+        return options.pool_options.max_pool_size
+    return client.max_pool_size
+
+
+def test_max_pool_size():
+    md = MDS(config={'host': 'localhost', 'max_pool_size': 7}, version=1)
+    assert _max_pool_size(md._connection) == 7
+    md.disconnect()
+
+    # without the key a pool size in the host URI is respected
+    md = MDS(config={'host': 'mongodb://localhost:27017/?maxPoolSize=10'},
+             version=1)
+    assert _max_pool_size(md._connection) == 10
+    md.disconnect()
+
+
+def test_disconnect_drops_handles(mds_all):
+    md = getattr(mds_all, '_DB_SINGLETON', mds_all)
+    conn = md._connection
+    event_col = md._event_col
+    md.disconnect()
+    assert md._MDSRO__conn is None
+    assert md._MDSRO__db is None
+    for name in ('event', 'descriptor', 'runstart', 'runstop'):
+        assert getattr(md, '_MDSRO__{}_col'.format(name)) is None
+    # reconnecting builds new handles
+    assert md._connection is not conn
+    assert md._event_col is not event_col
+
+
 def test_event_descriptor_insertion(mds_all):
     mds = mds_all
     # format some data keys for insertion
@@ -282,6 +343,98 @@ def test_bulk_insert(mds_all):
         assert ret['filled'] == {'Z': False}
 
 
+def test_bulk_insert_chunked(mds_all):
+    mdsc = mds_all
+    num = 50
+    rs, e_desc, data_keys = setup_syn(mdsc)
+    all_data = syn_data(data_keys, num)
+
+    # 50 events in chunks of 7 exercises both full and partial chunks
+    ret = mdsc.bulk_insert_events(e_desc, all_data, validate=False,
+                                  chunk_size=7)
+    assert ret['nInserted'] == num
+    assert ret['acknowledged']
+    assert ret['writeErrors'] == []
+    mdsc.insert_run_stop(rs, ttime.time(), uid=str(uuid.uuid4()))
+
+    ev_gen = mdsc.get_events_generator(e_desc)
+    assert [ev['uid'] for ev in ev_gen] == [d['uid'] for d in all_data]
+
+
+def test_bulk_insert_validate_inserts_nothing(mds_all):
+    mdsc = mds_all
+    num = 50
+    rs, e_desc, data_keys = setup_syn(mdsc)
+    all_data = syn_data(data_keys, num)
+    # the bad event is well past the first chunk
+    del all_data[30]['timestamps']['F']
+    with pytest.raises(ValueError):
+        mdsc.bulk_insert_events(e_desc, all_data, validate=True,
+                                chunk_size=7)
+    assert list(mdsc.get_events_generator(e_desc)) == []
+
+
+def test_bulk_insert_stops_at_duplicate(mds_all):
+    mdsc = mds_all
+    num = 20
+    rs, e_desc, data_keys = setup_syn(mdsc)
+    all_data = syn_data(data_keys, num)
+    all_data[12]['uid'] = all_data[3]['uid']
+    with pytest.raises(pymongo.errors.BulkWriteError):
+        mdsc.bulk_insert_events(e_desc, all_data, validate=False,
+                                chunk_size=5)
+    # ordered insert: everything before the duplicate went in, nothing after
+    inserted = [ev['uid'] for ev in mdsc.get_events_generator(e_desc)]
+    assert inserted == [d['uid'] for d in list(all_data)[:12]]
+
+
+@pytest.mark.parametrize('chunk_size', (0, -1, None))
+def test_bulk_insert_bad_chunk_size(mds_all, chunk_size):
+    mdsc = mds_all
+    rs, e_desc, data_keys = setup_syn(mdsc)
+    all_data = syn_data(data_keys, 5)
+    with pytest.raises(ValueError):
+        mdsc.bulk_insert_events(e_desc, all_data, chunk_size=chunk_size)
+
+
+def test_unacknowledged_inserts(mds_all):
+    mdsc = mds_all
+    num = 20
+    rs, e_desc, data_keys = setup_syn(mdsc)
+    all_data = list(syn_data(data_keys, num))
+    w0 = pymongo.WriteConcern(w=0)
+
+    ret = mdsc.bulk_insert_events(e_desc, all_data[:10], chunk_size=3,
+                                  write_concern=w0)
+    assert not ret['acknowledged']
+    assert ret['nInserted'] == 0
+    for d in all_data[10:]:
+        mdsc.insert_event(e_desc, write_concern=w0, **d)
+
+    # unacknowledged writes may still be in flight, wait for them to land
+    deadline = ttime.time() + 5
+    while True:
+        events = list(mdsc.get_events_generator(e_desc))
+        if len(events) == num or ttime.time() > deadline:
+            break
+        ttime.sleep(0.05)
+    assert [ev['uid'] for ev in events] == [d['uid'] for d in all_data]
+
+
+def test_event_col_with_write_concern_reused(mds_all):
+    md = getattr(mds_all, '_DB_SINGLETON', mds_all)
+    assert md._event_col_with(None) is md._event_col
+
+    col = md._event_col_with(pymongo.WriteConcern(w=0))
+    assert col.write_concern.document == {'w': 0}
+    # an equal write concern gets the same handle back
+    assert md._event_col_with(pymongo.WriteConcern(w=0)) is col
+    assert md._event_col_with(pymongo.WriteConcern(w=1)) is not col
+
+    md.disconnect()
+    assert md._event_col_with(pymongo.WriteConcern(w=0)) is not col
+
+
 def test_iterative_insert(mds_all):
     mdsc = mds_all
     num = 50
@@ -361,6 +514,111 @@ def test_run_stop_by_run_start(mds_all):
     assert ev_desc == ev_desc3
 
 
+def test_descriptors_by_start_order(mds_all):
+    mdsc = mds_all
+    run_start_uid, e_desc_uid, data_keys = setup_syn(mdsc)
+    # insert a descriptor that is older than the one from setup_syn
+    old_uid = mdsc.insert_descriptor(run_start_uid, data_keys,
+                                     ttime.time() - 10, str(uuid.uuid4()))
+
+    descs = mdsc.descriptors_by_start(run_start_uid)
+    assert [d['uid'] for d in descs] == [old_uid, e_desc_uid]
+
+
+def test_stop_by_start_cached(mds_all):
+    mdsc = mds_all
+    run_start_uid, e_desc_uid, data_keys = setup_syn(mdsc)
+    with pytest.raises(NoRunStop):
+        mdsc.stop_by_start(run_start_uid)
+
+    # a miss must not be cached: insert the RunStop behind this
+    # instance's back so its cache is not updated by the insert
+    md = getattr(mdsc, '_DB_SINGLETON', mdsc)
+    run_stop_uid = str(uuid.uuid4())
+    md._runstop_col.insert_one(dict(run_start=run_start_uid,
+                                    time=ttime.time(), uid=run_stop_uid,
+                                    exit_status='success'))
+    run_stop = mdsc.stop_by_start(run_start_uid)
+    assert run_stop['uid'] == run_stop_uid
+    assert mdsc.stop_by_start(run_start_uid) is run_stop
+
+    mdsc.clear_process_cache()
+    assert mdsc.stop_by_start(run_start_uid) == run_stop
+
+
+class _CountingCollection(object):
+    """Wrap a pymongo Collection and count the queries made on it"""
+    def __init__(self, col):
+        self._col = col
+        self.find_calls = 0
+        self.find_one_calls = 0
+
+    def find(self, *args, **kwargs):
+        self.find_calls += 1
+        return self._col.find(*args, **kwargs)
+
+    def find_one(self, *args, **kwargs):
+        self.find_one_calls += 1
+        return self._col.find_one(*args, **kwargs)
+
+    def __getattr__(self, name):
+        return getattr(self._col, name)
+
+
+def test_find_prefetches_run_starts(mds_all):
+    md = getattr(mds_all, '_DB_SINGLETON', mds_all)
+    run_start_uids = []
+    for j in range(3):
+        run_start_uid, e_desc_uid, data_keys = setup_syn(md)
+        md.insert_run_stop(run_start_uid, ttime.time(),
+                           uid=str(uuid.uuid4()))
+        run_start_uids.append(run_start_uid)
+    md.clear_process_cache()
+
+    start_col = _CountingCollection(md._runstart_col)
+    stops = list(core.find_run_stops(start_col, md._RUNSTART_CACHE,
+                                     md._runstop_col, md._RUNSTOP_CACHE,
+                                     'US/Eastern'))
+    assert len(stops) == 3
+    # one query for all of the RunStarts, none per result
+    assert start_col.find_calls == 1
+    assert start_col.find_one_calls == 0
+    for uid in run_start_uids:
+        assert uid in md._RUNSTART_CACHE
+
+    # with a warm cache the RunStarts are not queried at all
+    descs = list(core.find_descriptors(start_col, md._RUNSTART_CACHE,
+                                       md._descriptor_col,
+                                       md._DESCRIPTOR_CACHE,
+                                       'US/Eastern'))
+    assert len(descs) == 3
+    assert start_col.find_calls == 1
+    assert start_col.find_one_calls == 0
+
+
+def test_find_with_run_start_batches(mds_all):
+    md = getattr(mds_all, '_DB_SINGLETON', mds_all)
+    run_start_uids = []
+    for j in range(3):
+        run_start_uid, e_desc_uid, data_keys = setup_syn(md)
+        md.insert_run_stop(run_start_uid, ttime.time(),
+                           uid=str(uuid.uuid4()))
+        run_start_uids.append(run_start_uid)
+    md.clear_process_cache()
+
+    start_col = _CountingCollection(md._runstart_col)
+    raw = list(core._find_with_run_start(md._runstop_col, {},
+                                         [('time', pymongo.ASCENDING)],
+                                         start_col, md._RUNSTART_CACHE,
+                                         batch_size=2))
+    # one full batch of 2 flushed mid-loop, then the leftover 1
+    assert [r['run_start'] for r in raw] == run_start_uids
+    assert start_col.find_calls == 2
+    assert start_col.find_one_calls == 0
+    for uid in run_start_uids:
+        assert uid in md._RUNSTART_CACHE
+
+
 def test_find_run_start(mds_all):
     mdsc = mds_all
     run_start_uid, e_desc_uid, data_keys = setup_syn(mdsc)
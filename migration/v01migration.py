@@ -57,11 +57,11 @@ def main(target, source):
     new = new_t
     old = old_t
     # old._runstart_col.drop_indexes()
-    total = old._runstart_col.find().count()
+    total = old._runstart_col.estimated_document_count()
     for start in tqdm(old.find_run_starts(), desc='start docs', total=total):
         new.insert('start', start)
 
-    total = old._runstop_col.find().count()
+    total = old._runstop_col.estimated_document_count()
     for stop in tqdm(old.find_run_stops(), desc='stop docs', total=total):
         try:
             new.insert('stop', stop)
@@ -71,11 +71,11 @@ def main(target, source):
     descs = deque()
     counts = deque()
     old._descriptor_col.drop_indexes()
-    total = old._descriptor_col.find().count()
+    total = old._descriptor_col.estimated_document_count()
     for desc in tqdm(old.find_descriptors(), unit='descriptors', total=total):
-        d_raw = next(old._descriptor_col.find({'uid': desc['uid']}))
-        num_events = old._event_col.find(
-            {'descriptor_id': d_raw['_id']}).count()
+        d_raw = old._descriptor_col.find_one({'uid': desc['uid']})
+        num_events = old._event_col.count_documents(
+            {'descriptor_id': d_raw['_id']})
         new.insert('descriptor', desc)
         out = dict(desc)
         out['run_start'] = out['run_start']['uid']
@@ -98,19 +98,10 @@ def main(target, source):
                 try:
                     events = old.get_events_generator(descriptor=desc_in,
                                                       convert_arrays=False)
-                    events = iter(events)
-                    l_cache = deque()
-                    while True:
-                        try:
-                            for j in range(5000):
-                                l_cache.append(next(events))
-                        except StopIteration:
-                            break
-                        finally:
-                            if l_cache:
-                                new.bulk_insert_events(descriptor=desc_in,
-                                                       events=l_cache)
-                            l_cache.clear()
+                    # bulk_insert_events consumes the generator in chunks,
+                    # so the stream is never held in memory
+                    new.bulk_insert_events(descriptor=desc_in, events=events,
+                                           chunk_size=5000)
                 except KeyError:
                     print("here here, key error")
                 except pymongo.errors.AutoReconnect:
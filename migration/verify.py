@@ -41,26 +41,27 @@ new_config['database'] = NEW_DATABASE
 old = MDSRO(version=0, config=old_config)
 new = MDS(version=1, config=new_config)
 
-total = old._runstart_col.find().count()
+total = old._runstart_col.estimated_document_count()
 old_starts = tqdm(old.find_run_starts(), unit='start docs', total=total,
                   leave=True)
 new_starts = new.find_run_starts()
 for o, n in zip(old_starts, new_starts):
     compare(o, n)
 
-total = old._runstop_col.find().count()
+total = old._runstop_col.estimated_document_count()
 old_stops = tqdm(old.find_run_stops(), unit='stop docs', total=total)
 new_stops = new.find_run_stops()
 for o, n in zip(old_stops, new_stops):
     compare(o, n)
 descs = deque()
 counts = deque()
-total = old._descriptor_col.find().count()
+total = old._descriptor_col.estimated_document_count()
 old_descs = tqdm(old.find_descriptors(), unit='descriptors', total=total)
 new_descs = new.find_descriptors()
 for o, n in zip(old_descs, new_descs):
-    d_raw = next(old._descriptor_col.find({'uid': o['uid']}))
-    num_events = old._event_col.find({'descriptor_id': d_raw['_id']}).count()
+    d_raw = old._descriptor_col.find_one({'uid': o['uid']})
+    num_events = old._event_col.count_documents(
+        {'descriptor_id': d_raw['_id']})
     assert o == n
     descs.append(o)
     counts.append(num_events)